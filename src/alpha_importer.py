@@ -11,8 +11,44 @@ import pandas as pd
 import numpy as np
 import pickle
 import os
+import functools
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
+
+
+# Labels for the middle rows in display_transformed_dataframe, keyed by row position
+_ORDINAL_POSITIONS = {
+    1: "SECOND", 2: "THIRD", 3: "FOURTH", 4: "FIFTH",
+    5: "SIXTH", 6: "SEVENTH", 7: "EIGHTH", 8: "NINTH", 9: "TENTH"
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_filename(filename: str) -> Optional[Tuple[str, str]]:
+    """
+    Split an export name like alpha_transphormed_N8_phi_1_2_3_harmonic.pkl into its parts.
+    Cached, since the listing, dataframe and encoding views all parse the same names.
+    
+    Returns:
+        Optional[Tuple[str, str]]: (mod table, N/phi parameters), or None if the
+                                   name does not follow the export naming scheme
+    """
+    if "_transphormed_" not in filename:
+        return None
+    parts = filename.split("_transphormed_")
+    if len(parts) != 2:
+        return None
+    suffix_part = parts[1].replace(".pkl", "")
+    
+    # Extract mod table type from suffix
+    if "_" in suffix_part:
+        suffix_parts = suffix_part.split("_")
+        mod_table = suffix_parts[-1]  # Last part should be mod table name
+        n_and_phi = "_".join(suffix_parts[:-1])  # Everything before mod table
+    else:
+        mod_table = "unknown"
+        n_and_phi = suffix_part
+    return mod_table, n_and_phi
 
 
 class AlphaImporter:
@@ -52,8 +88,13 @@ class AlphaImporter:
         if not self.input_dir.exists():
             return []
         
-        pickle_files = list(self.input_dir.glob("*.pkl"))
-        return [f.name for f in pickle_files]
+        # scandir already knows each entry's type, so no extra stat per file. The suffix
+        # check ignores case, as Path.glob("*.pkl") does on Windows
+        with os.scandir(self.input_dir) as entries:
+            return [
+                entry.name for entry in entries
+                if entry.name.lower().endswith(".pkl") and entry.is_file()
+            ]
     
     def display_available_files(self) -> None:
         """
@@ -67,13 +108,15 @@ class AlphaImporter:
             print(f"   Make sure you've run the pipeline and generated some data first.")
             return
         
+        # Stat each file once; the results feed both the recency check and the sizes
+        file_stats = {filename: (self.input_dir / filename).stat() for filename in files}
+        
         # Find the most recently created file
         most_recent_file = None
         most_recent_time = 0
         
         for filename in files:
-            file_path = self.input_dir / filename
-            creation_time = file_path.stat().st_mtime
+            creation_time = file_stats[filename].st_mtime
             if creation_time > most_recent_time:
                 most_recent_time = creation_time
                 most_recent_file = filename
@@ -85,36 +128,20 @@ class AlphaImporter:
         print(f"Found {len(files)} file(s):")
         
         for i, filename in enumerate(files, 1):
-            file_path = self.input_dir / filename
-            file_size = file_path.stat().st_size
+            file_size = file_stats[filename].st_size
             
             # Check if this is the most recent file
             is_most_recent = (filename == most_recent_file)
             recent_marker = " 🆕 [MOST RECENT]" if is_most_recent else ""
             
             # Parse filename to extract info
-            if "_transphormed_" in filename:
-                parts = filename.split("_transphormed_")
-                if len(parts) == 2:
-                    prefix = parts[0]
-                    suffix_part = parts[1].replace(".pkl", "")
-                    
-                    # Extract mod table type from suffix
-                    if "_" in suffix_part:
-                        suffix_parts = suffix_part.split("_")
-                        mod_table = suffix_parts[-1]  # Last part should be mod table name
-                        n_and_phi = "_".join(suffix_parts[:-1])  # Everything before mod table
-                    else:
-                        mod_table = "unknown"
-                        n_and_phi = suffix_part
-                    
-                    print(f"   {i}. {filename}{recent_marker}")
-                    print(f"      └─ Mod Table: {mod_table.upper()}")
-                    print(f"      └─ Parameters: {n_and_phi}")
-                    print(f"      └─ Size: {file_size:,} bytes")
-                else:
-                    print(f"   {i}. {filename}{recent_marker}")
-                    print(f"      └─ Size: {file_size:,} bytes")
+            parsed = _parse_filename(filename)
+            if parsed is not None:
+                mod_table, n_and_phi = parsed
+                print(f"   {i}. {filename}{recent_marker}")
+                print(f"      └─ Mod Table: {mod_table.upper()}")
+                print(f"      └─ Parameters: {n_and_phi}")
+                print(f"      └─ Size: {file_size:,} bytes")
             else:
                 print(f"   {i}. {filename}{recent_marker}")
                 print(f"      └─ Size: {file_size:,} bytes")
@@ -222,14 +249,8 @@ class AlphaImporter:
         print(f"Source file: {self.current_file}")
         
         # Extract and display mod table from filename
-        mod_table = "unknown"
-        if self.current_file and "_transphormed_" in self.current_file:
-            parts = self.current_file.split("_transphormed_")
-            if len(parts) == 2:
-                suffix_part = parts[1].replace(".pkl", "")
-                if "_" in suffix_part:
-                    suffix_parts = suffix_part.split("_")
-                    mod_table = suffix_parts[-1]  # Last part should be mod table name
+        parsed = _parse_filename(self.current_file) if self.current_file else None
+        mod_table = parsed[0] if parsed is not None else "unknown"
         
         print(f"📋 Mod Table: {mod_table.upper()}")
         
@@ -284,9 +305,11 @@ class AlphaImporter:
             # Define position names and track total array count
             total_rows = len(df)
             total_array_count = 0
+            # One entry per row can run to hundreds of lines, so collect them and print once
+            lines = []
             
-            for i, (idx, row) in enumerate(df.iterrows()):
-                alpha_value = row['Alpha_Phormed']
+            # Walk the column directly; iterrows would build a Series for every row
+            for i, (idx, alpha_value) in enumerate(df['Alpha_Phormed'].items()):
                 
                 # Determine position label
                 if total_rows == 1:
@@ -297,32 +320,33 @@ class AlphaImporter:
                     position = "LAST"
                 else:
                     # Use ordinal numbers for middle positions
-                    ordinal_map = {
-                        1: "SECOND", 2: "THIRD", 3: "FOURTH", 4: "FIFTH",
-                        5: "SIXTH", 6: "SEVENTH", 7: "EIGHTH", 8: "NINTH", 9: "TENTH"
-                    }
-                    position = ordinal_map.get(i, f"{i+1}TH")
+                    position = _ORDINAL_POSITIONS.get(i, f"{i+1}TH")
                 
-                print(f"   {position}: {idx}")
+                lines.append(f"   {position}: {idx}")
                 if isinstance(alpha_value, list) and len(alpha_value) > 0:
                     array_count = len(alpha_value)
-                    print(f"          └─ Array count: {array_count}")
+                    lines.append(f"          └─ Array count: {array_count}")
                     total_array_count += array_count
                 else:
-                    print(f"          └─ Data type: {type(alpha_value)}")
+                    lines.append(f"          └─ Data type: {type(alpha_value)}")
                 
                 # Add spacing between entries (except after the last one)
                 if i < total_rows - 1:
-                    print()
+                    lines.append("")
             
             # Show total aggregation
-            print()
-            print("=" * 50)
-            print(f"📊 TOTAL ARRAY COUNT: {total_array_count:,}")
-            print("=" * 50)
+            lines.extend(["", "=" * 50, f"📊 TOTAL ARRAY COUNT: {total_array_count:,}", "=" * 50])
+            print("\n".join(lines))
         
         print(f"\n💡 This is the transformed alpha data ready for encoding!")
     
+    @staticmethod
+    def _total_array_count(df: pd.DataFrame) -> int:
+        """Total number of arrays across the Alpha_Phormed rows of df."""
+        return sum(
+            len(alpha_value) for alpha_value in df['Alpha_Phormed'] if isinstance(alpha_value, list)
+        )
+    
     def get_dataframe(self) -> Optional[pd.DataFrame]:
         """
         Get the transformed alpha dataframe for further processing.
@@ -424,24 +448,15 @@ class AlphaImporter:
         print(f"Source file: {self.current_file}")
         
         # Extract and display mod table from filename  
-        mod_table = "unknown"
-        if self.current_file and "_transphormed_" in self.current_file:
-            parts = self.current_file.split("_transphormed_")
-            if len(parts) == 2:
-                suffix_part = parts[1].replace(".pkl", "")
-                if "_" in suffix_part:
-                    suffix_parts = suffix_part.split("_")
-                    mod_table = suffix_parts[-1]  # Last part should be mod table name
+        parsed = _parse_filename(self.current_file) if self.current_file else None
+        mod_table = parsed[0] if parsed is not None else "unknown"
         
         print(f"📋 Mod Table: {mod_table.upper()}")
         
         # Calculate total arrays for encoding
         total_arrays = 0
         if 'Alpha_Phormed' in df.columns:
-            for _, row in df.iterrows():
-                alpha_value = row['Alpha_Phormed']
-                if isinstance(alpha_value, list):
-                    total_arrays += len(alpha_value)
+            total_arrays = self._total_array_count(df)
         
         print(f"Total arrays to encode: {total_arrays:,}")
         print()
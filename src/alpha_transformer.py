@@ -5,6 +5,7 @@
 import pandas as pd
 import numpy as np
 import os
+import functools
 from phorms_mod_table import phorms_mod_table
 
 
@@ -14,18 +15,42 @@ class AlphaTransformer:
     Designed to be extensible for music theory applications and decision trees.
     """
     
-    def __init__(self, mod_table_version: str = "default", output_dir: str = "F:/Enki_V3/data/alpha_output"):
+    def __init__(self, mod_table_version: str = "default", output_dir: str = "F:/Enki_V3/data/alpha_output",
+                 verbose: bool = True):
         self.mod_table_version = mod_table_version
         self.output_dir = output_dir
+        self.verbose = verbose
         self.phorms_mod_table_df = None
         self.transphormed_alpha_dataframe = None
-        os.makedirs(self.output_dir, exist_ok=True)
+    
+    def _log(self, template, *args):
+        """
+        Prints a progress message when verbose output is enabled.
+        The message is only formatted (str.format with args) when it is printed.
+        """
+        if self.verbose:
+            print(template.format(*args) if args else template)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _load_table(mod_table_version):
+        """Build each mod table once per process; transformers only read it."""
+        return phorms_mod_table(mod_table_version)
     
     def load_mod_table(self):
         """Generate the Phorms Mod Table using the external function."""
-        self.phorms_mod_table_df = phorms_mod_table(self.mod_table_version)
+        self.phorms_mod_table_df = self._load_table(self.mod_table_version)
         return self.phorms_mod_table_df
     
+    def set_mod_table(self, mod_table_version):
+        """
+        Switch this transformer to another mod table so one instance can be reused.
+        Any previous result is dropped, since its export name would no longer match.
+        """
+        self.mod_table_version = mod_table_version
+        self.transphormed_alpha_dataframe = None
+        return self.load_mod_table()
+    
     def transform_alpha_dataframe(self, alpha_phorms_dataframe, max_value=9):
         """
         Transforms the alpha_phorms_dataframe using the phorms_mod_table_df and creates a new DataFrame.
@@ -46,33 +71,107 @@ class AlphaTransformer:
         if self.phorms_mod_table_df is None:
             self.load_mod_table()
 
-        # Create a copy to avoid modifying the original
-        alpha_phorms_dataframe = alpha_phorms_dataframe.copy()
+        return self.transform_from_arrays(self.prepare_alpha_arrays(alpha_phorms_dataframe), max_value)
+    
+    @staticmethod
+    def prepare_alpha_arrays(alpha_phorms_dataframe):
+        """
+        Pulls the columns the transformation needs out of the alpha DataFrame once.
+        The result can be handed to transform_from_arrays() by any number of
+        transformers, so running several mod tables over the same data only
+        pays for the DataFrame walk a single time.
+        
+        Args:
+            alpha_phorms_dataframe: DataFrame containing alpha values to transform
+            
+        Returns:
+            dict: Column name -> list of per-row values, plus the row index and, when
+                  every A_Root_Copy row and every Alpha_PV_Mod row has the same length,
+                  the NumPy arrays the lookup-table transformation works on
+        """
+        alpha_arrays = {
+            'index': list(alpha_phorms_dataframe.index),
+            'A_Root': [[int(x) for x in values] for values in alpha_phorms_dataframe['A_Root']],
+            'A_Root_Copy': [[int(x) for x in values] for values in alpha_phorms_dataframe['A_Root_Copy']],
+            'Alpha_PV_Mod': [[int(x) for x in values] for values in alpha_phorms_dataframe['Alpha_PV_Mod']],
+            'Repeater': [int(x) for x in alpha_phorms_dataframe['Repeater']],
+        }
+
+        # The distinct input values and each copy value's position among them do not
+        # depend on the mod table, so every transformation can share them. Ragged rows
+        # cannot be stacked into arrays and are transformed row by row instead.
+        copy_lengths = {len(values) for values in alpha_arrays['A_Root_Copy']}
+        mod_lengths = {len(values) for values in alpha_arrays['Alpha_PV_Mod']}
+        if len(copy_lengths) == 1 and len(mod_lengths) == 1:
+            copies = np.array(alpha_arrays['A_Root_Copy'], dtype=np.int64)
+            copy_values, copy_value_idx = np.unique(copies, return_inverse=True)
+            alpha_arrays['copy_values'] = copy_values
+            alpha_arrays['copy_value_idx'] = copy_value_idx.reshape(copies.shape)
+            alpha_arrays['mods'] = np.array(alpha_arrays['Alpha_PV_Mod'], dtype=np.int64)
+        return alpha_arrays
+    
+    @classmethod
+    def transform_multi(cls, alpha_phorms_dataframe, mod_table_versions, max_value=9, verbose=True):
+        """
+        Transforms the same alpha data with several mod tables in one go.
+        The DataFrame is only walked once; each mod table then only builds its
+        lookup table and does a single gather over the shared arrays.
+        
+        Args:
+            alpha_phorms_dataframe: DataFrame containing alpha values to transform
+            mod_table_versions: Names of the mod tables to apply
+            max_value: Maximum value for modulo operations (default: 9)
+            verbose: Print each transformed DataFrame as it is created (default: True)
+            
+        Returns:
+            dict: Mod table name -> transformed DataFrame
+        """
+        alpha_arrays = cls.prepare_alpha_arrays(alpha_phorms_dataframe)
+        transformer = cls(verbose=verbose)
+        results = {}
+        for version in mod_table_versions:
+            transformer.set_mod_table(version)
+            results[version] = transformer.transform_from_arrays(alpha_arrays, max_value)
+        return results
+    
+    def transform_from_arrays(self, alpha_arrays, max_value=9):
+        """
+        Transforms alpha data already extracted by prepare_alpha_arrays().
         
+        Args:
+            alpha_arrays: Column bundle returned by prepare_alpha_arrays()
+            max_value: Maximum value for modulo operations (default: 9)
+            
+        Returns:
+            DataFrame: Transformed alpha data
+        """
+        # Ensure the mod table is loaded
+        if self.phorms_mod_table_df is None:
+            self.load_mod_table()
+
         # Initialize a dictionary to store the transformed outputs
         transformed_data = {}
 
-        # Iterate through each row in the alpha_phorms_dataframe
-        for index, row in alpha_phorms_dataframe.iterrows():
-            # Extract the values
-            A_Root = [int(x) for x in row['A_Root']]
-            A_Root_Copy = [int(x) for x in row['A_Root_Copy']]
-            Alpha_PV_Mod = [int(x) for x in row['Alpha_PV_Mod']]
-            Repeater = int(row['Repeater'])
-
-            # Initialize with the original A_Root
-            modified_versions = [A_Root]
-
-            # Apply transformations for each mod value
-            for mod in Alpha_PV_Mod:
-                if mod in self.phorms_mod_table_df.index:
-                    transformed_row = [
-                        int((self.phorms_mod_table_df.loc[mod, 'Transformation'](value) % (max_value + 1)))
-                        if self.phorms_mod_table_df.loc[mod, 'Transformation'](value) >= 0
-                        else max_value
-                        for value in A_Root_Copy
-                    ]
-                    modified_versions.append(transformed_row)
+        # Every transformation maps one small integer to another, so rather than calling
+        # the lambdas per value, evaluate them once per distinct input and gather with NumPy
+        transformed_rows, known_mods = self._lookup_transformations(alpha_arrays, max_value)
+
+        # Iterate through the rows of the column bundle
+        rows = zip(
+            alpha_arrays['index'],
+            alpha_arrays['A_Root'],
+            transformed_rows,
+            known_mods,
+            alpha_arrays['Repeater'],
+        )
+        for index, A_Root, transformed, known, Repeater in rows:
+            # Initialize with the original A_Root, followed by one row per mod value
+            modified_versions = [list(A_Root)]
+            if all(known):
+                modified_versions.extend(transformed)
+            else:
+                # Mod values missing from the table are skipped
+                modified_versions.extend(row for row, ok in zip(transformed, known) if ok)
 
             # Handle repetition based on the Repeater value
             if Repeater == 0:
@@ -91,10 +190,64 @@ class AlphaTransformer:
             transformed_data, orient='index', columns=['Alpha_Phormed']
         )
 
-        print("\nTransformed Alpha DataFrame created.")
-        print(self.transphormed_alpha_dataframe)
+        self._log("\nTransformed Alpha DataFrame created.\n{}", self.transphormed_alpha_dataframe)
         return self.transphormed_alpha_dataframe
     
+    def _lookup_transformations(self, alpha_arrays, max_value):
+        """
+        Applies the mod table to every A_Root_Copy / Alpha_PV_Mod pair in one NumPy gather,
+        or row by row when prepare_alpha_arrays() found ragged rows.
+        
+        Args:
+            alpha_arrays: Column bundle returned by prepare_alpha_arrays()
+            max_value: Maximum value for modulo operations
+            
+        Returns:
+            tuple: (per-row lists of transformed rows, per-row lists of flags marking
+                    which mod values exist in the mod table)
+        """
+        if not alpha_arrays['index']:
+            return [], []
+
+        transformations = self.phorms_mod_table_df['Transformation'].to_dict()
+        modulus = max_value + 1
+
+        def apply(transform, value):
+            result = transform(value)
+            return int(result % modulus) if result >= 0 else max_value
+
+        if 'copy_values' not in alpha_arrays:
+            # Ragged rows: apply the lambdas per value, row by row
+            transformed_rows, known_mods = [], []
+            for copy_row, mods in zip(alpha_arrays['A_Root_Copy'], alpha_arrays['Alpha_PV_Mod']):
+                known = [mod in transformations for mod in mods]
+                transformed_rows.append([
+                    [apply(transformations[mod], value) for value in copy_row] if ok else []
+                    for mod, ok in zip(mods, known)
+                ])
+                known_mods.append(known)
+            return transformed_rows, known_mods
+
+        values = alpha_arrays['copy_values']
+        value_idx = alpha_arrays['copy_value_idx']
+        mods = alpha_arrays['mods']
+
+        # Lookup table: one row per mod key, one column per distinct input value
+        mod_keys = np.array(sorted(transformations), dtype=np.int64)
+        lookup = np.empty((len(mod_keys), len(values)), dtype=np.int64)
+        for i, mod in enumerate(mod_keys.tolist()):
+            transform = transformations[mod]
+            for j, value in enumerate(values.tolist()):
+                lookup[i, j] = apply(transform, value)
+
+        # Position of each mod value in the table, and whether it is there at all
+        mod_idx = np.searchsorted(mod_keys, mods).clip(max=len(mod_keys) - 1)
+        known = mod_keys[mod_idx] == mods
+
+        # (rows, mods, values): the transformed A_Root_Copy for every mod of every row
+        transformed = lookup[mod_idx[:, :, None], value_idx[:, None, :]]
+        return transformed.tolist(), known.tolist()
+    
     def _validate_structure(self, repeated_rows, index):
         """Validate that repeated_rows has the correct structure."""
         for array in repeated_rows:
@@ -121,8 +274,10 @@ class AlphaTransformer:
         output_file = os.path.join(self.output_dir, filename)
 
         try:
+            # Created here rather than in __init__ so transform-only use never touches the disk
+            os.makedirs(self.output_dir, exist_ok=True)
             self.transphormed_alpha_dataframe.to_pickle(output_file)
-            print(f"\nTransformed Alpha DataFrame exported to '{output_file}'.")
+            self._log("\nTransformed Alpha DataFrame exported to '{}'.", output_file)
             return output_file
         except Exception as e:
             print(f"Error exporting DataFrame: {e}")
@@ -138,7 +293,7 @@ class AlphaTransformer:
             theory_type: Type of music theory to apply
         """
         # This is where you would implement specific music theory transformations
-        print(f"Applying {theory_type} music theory transformation...")
+        self._log("Applying {} music theory transformation...", theory_type)
         # Implementation would go here
         pass
     
@@ -151,6 +306,6 @@ class AlphaTransformer:
             decision_rules: Rules for the decision tree
         """
         # This is where you would implement decision tree logic
-        print("Applying decision tree transformation...")
+        self._log("Applying decision tree transformation...")
         # Implementation would go here
         pass
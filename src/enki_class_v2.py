@@ -5,11 +5,74 @@ import numpy as np
 import pandas as pd
 import random
 import os
-from IPython.display import clear_output
+
+
+def _clear_output():
+    """
+    Clears the notebook output cell when running under IPython.
+    IPython is optional and slow to import, so it is only loaded on first use.
+    """
+    try:
+        from IPython.display import clear_output
+    except ImportError:
+        return
+    clear_output(wait=True)
+
+
+# PVA code for a step between neighbouring values, indexed by sign(difference) + 1:
+# falling -> 0, flat -> 2, rising -> 1
+_PVA_BY_SIGN = np.array([0, 2, 1])
+
 
 # Enki class definition
 class Enki_V3:
-    def __init__(self, output_dir: str = "F:/Enki_V3/data/alpha_output"):
+    # Data generation steps 2-20, in order; step 1 is the N prompt in run_pipeline
+    GENERATION_STEPS = (
+        "create_base",                    # Step 2: Create the base array (phi_)
+        "root_arrays",                    # Step 3: Create a list of root arrays
+        "create_kappa_root_arrays",       # Step 4: Create kappa root arrays
+        "create_data_triangle_roots",     # Step 5: Create data triangle roots
+        "update_theta_root",              # Step 6: Update roots w/ (theta)
+        "update_lambda_root",             # Step 7: Update roots w/ (lambda)
+        "update_epsilon_root",            # Step 8: Update roots w/ (epsilon)
+        "update_kappa_roots",             # Step 9: Update roots w/ (kappa_roots_)
+        "combine_all_values_DT",          # Step 10: Combine all values of Data Triangle
+        "create_pva_array",               # Step 11: Create PVA array
+        "create_DT_dataframe",            # Step 12: Create DataFrame for data triangle
+        "create_PVA_Mods",                # Step 13: Create PVA Mods
+        "create_PVA_Mods_dataframe",      # Step 14: Create PVA Mods DF
+        "create_alpha_roots_rows",        # Step 15: Create Alpha Roots Rows
+        "create_alpha_roots_post_pivot",  # Step 16: Create Alpha Roots Post Pivot
+        "combine_alpha_roots",            # Step 17: Combine Alpha Roots
+        "create_alpha_roots_dataframe",   # Step 18: Create Alpha Roots DataFrame
+        "create_alpha",                   # Step 19: Create Alpha Values
+        "create_alpha_phorms_dataframe",  # Step 20: Create Alpha Phorms DataFrame
+    )
+
+    # What run_pipeline reports after each step: label template and the attributes it shows
+    _STEP_REPORTS = {
+        "create_base": ("phi_: {}", ("phi_",)),
+        "root_arrays": ("Roots Arrays: {}", ("roots_list_",)),
+        "create_kappa_root_arrays": ("Kappa Roots: {}, Kappa Total: {}", ("kappa_roots_", "kappa_total")),
+        "create_data_triangle_roots": ("Data Triangle Roots: {}", ("data_triangle_roots",)),
+        "update_theta_root": ("Data Triangle Roots w/ Theta: {}", ("data_triangle_roots",)),
+        "update_lambda_root": ("Data Triangle Roots w/ Lambda: {}", ("data_triangle_roots",)),
+        "update_epsilon_root": ("Data Triangle Roots w/ Epsilon: {}", ("data_triangle_roots",)),
+        "update_kappa_roots": ("Data Triangle Roots w/ Kappa Roots: {}", ("data_triangle_roots",)),
+        "combine_all_values_DT": ("Combined Values of Data Triangle: {}", ("combined_values_of_data_triangle",)),
+        "create_pva_array": ("PVA Array: {}", ("pva_array",)),
+        "create_DT_dataframe": ("Data Triangle DataFrame:\n{}", ("DT_df",)),
+        "create_PVA_Mods": ("PVA Mods:\n{}", ("PVA_Mods",)),
+        "create_PVA_Mods_dataframe": ("PVA Mods DataFrame:\n{}", ("PVA_Mods_df",)),
+        "create_alpha_roots_rows": ("Alpha Roots Pre-Pivot:\n{}", ("alpha_roots_pre_pivot",)),
+        "create_alpha_roots_post_pivot": ("Alpha Roots Post-Pivot:\n{}", ("alpha_roots_post_pivot",)),
+        "combine_alpha_roots": ("Combined Alpha Roots:\n{}", ("combined_alpha_roots",)),
+        "create_alpha_roots_dataframe": ("Alpha Roots DataFrame:\n{}", ("alpha_roots_df",)),
+        "create_alpha": ("Alpha Values:\n{}", ("alpha_values",)),
+        "create_alpha_phorms_dataframe": ("Alpha DataFrame (Phorms):\n{}", ("alpha_phorms_dataframe",)),
+    }
+
+    def __init__(self, output_dir: str = "F:/Enki_V3/data/alpha_output", verbose: bool = True):
 
         self.N = None
         self.phi_ = None
@@ -17,6 +80,7 @@ class Enki_V3:
         self.kappa_roots_ = None
         self.kappa_total = None
         self.data_triangle_roots = None
+        self._root_positions = None
         self.data_triangle_roots_w_theta = None
         self.data_triangle_roots_w_lambda = None
         self.data_triangle_roots_w_epsilon = None
@@ -34,13 +98,22 @@ class Enki_V3:
         self.alpha_values = None
         self.alpha_phorms_dataframe = None
         self.output_dir = output_dir
+        self.verbose = verbose
         os.makedirs(self.output_dir, exist_ok=True)
 
+    def _log(self, template, *args):
+        """
+        Prints a progress message when verbose output is enabled.
+        The message is only formatted (str.format with args) when it is printed.
+        """
+        if self.verbose:
+            print(template.format(*args) if args else template)
+
     # User input declaration: Value for n
     def get_user_input(self) -> int:
         while True:
             try:
-                clear_output(wait=True)
+                _clear_output()
                 user_input = input(
                     "Enki: Welcome...I am Enki."
                     "\nEnki: Enter an integer for n (6-15) or 'q' to quit: \n"
@@ -55,7 +128,7 @@ class Enki_V3:
 
     # Step 1. This function is the main user interface that interacts with the user
     def Enki_User_Interface(self):
-        clear_output(wait=True)
+        _clear_output()
         while True:
             n = self.get_user_input()
             if n is not None:
@@ -99,112 +172,65 @@ class Enki_V3:
                 self.roots_list_[i] = ("chi_root", self.phi_.copy())
                 break
         self.data_triangle_roots = self.roots_list_ + self.kappa_roots_
+        # Steps 6-9 replace roots by name; index the positions once instead of scanning each time
+        self._root_positions = {name: i for i, (name, _) in enumerate(self.data_triangle_roots)}
         return self.data_triangle_roots
 
+    def _get_root(self, name):
+        """Returns the array stored under name in data_triangle_roots."""
+        position = self._root_positions.get(name)
+        if position is None:
+            raise ValueError(f"{name} not found in data_triangle_roots")
+        return self.data_triangle_roots[position][1]
+
+    def _set_root(self, name, values):
+        """Replaces the array stored under name in data_triangle_roots, if that root exists."""
+        position = self._root_positions.get(name)
+        if position is not None:
+            self.data_triangle_roots[position] = (name, values)
+
     # Step 6: Update data triangle roots (w/ theta)
     def update_theta_root(self):
-        chi_root = None
-        for name, array in self.data_triangle_roots:
-            if name == "chi_root":
-                chi_root = array
-                break
-        if chi_root is None:
-            raise ValueError("chi_root not found in data_triangle_roots")
-        theta_root_values = np.abs(np.diff(chi_root))
-        for i, (name, array) in enumerate(self.data_triangle_roots):
-            if name == "theta_root":
-                self.data_triangle_roots[i] = ("theta_root", theta_root_values)
-                break
+        chi_root = self._get_root("chi_root")
+        self._set_root("theta_root", np.abs(np.diff(chi_root)))
         return self.data_triangle_roots
 
     # Step 7: Update data triangle roots (w/ lambda)
     def update_lambda_root(self):
-        theta_root = None
-        for name, array in self.data_triangle_roots:
-            if name == "theta_root":
-                theta_root = array
-                break
-        if theta_root is None:
-            raise ValueError("theta_root not found in data_triangle_roots")
-        lambda_root_values = np.abs(np.diff(theta_root))
-        for i, (name, array) in enumerate(self.data_triangle_roots):
-            if name == "lambda_root":
-                self.data_triangle_roots[i] = ("lambda_root", lambda_root_values)
-                break
+        theta_root = self._get_root("theta_root")
+        self._set_root("lambda_root", np.abs(np.diff(theta_root)))
         return self.data_triangle_roots
 
     # Step 8: Update data triangle roots (w/ epsilon)
     def update_epsilon_root(self):
-        lambda_root = None
-        for name, array in self.data_triangle_roots:
-            if name == "lambda_root":
-                lambda_root = array
-                break
-        if lambda_root is None:
-            raise ValueError("lambda_root not found in data_triangle_roots")
-        epsilon_root_values = np.abs(np.diff(lambda_root))
-        for i, (name, array) in enumerate(self.data_triangle_roots):
-            if name == "epsilon_root":
-                self.data_triangle_roots[i] = ("epsilon_root", epsilon_root_values)
-                break
+        lambda_root = self._get_root("lambda_root")
+        self._set_root("epsilon_root", np.abs(np.diff(lambda_root)))
         return self.data_triangle_roots
 
     # Step 9: Update data triangle roots (w/ kappa_roots_)
     def update_kappa_roots(self):
-        epsilon_root = None
-        for name, array in self.data_triangle_roots:
-            if name == "epsilon_root":
-                epsilon_root = array
-                break
-        if epsilon_root is None:
-            raise ValueError("epsilon_root not found in data_triangle_roots")
-        kappa_root_0_values = np.abs(np.diff(epsilon_root))
-        for i, (name, array) in enumerate(self.data_triangle_roots):
-            if name == "kappa_root_0":
-                self.data_triangle_roots[i] = ("kappa_root_0", kappa_root_0_values)
-                break
+        epsilon_root = self._get_root("epsilon_root")
+        self._set_root("kappa_root_0", np.abs(np.diff(epsilon_root)))
         for kappa_index in range(self.kappa_total - 1):
-            current_kappa_name = f"kappa_root_{kappa_index}"
-            current_kappa = None
-            for name, array in self.data_triangle_roots:
-                if name == current_kappa_name:
-                    current_kappa = array
-                    break
-            if current_kappa is None:
-                raise ValueError(f"{current_kappa_name} not found in data_triangle_roots")
-            next_kappa_values = np.abs(np.diff(current_kappa))
-            next_kappa_name = f"kappa_root_{kappa_index + 1}"
-            for i, (name, array) in enumerate(self.data_triangle_roots):
-                if name == next_kappa_name:
-                    self.data_triangle_roots[i] = (next_kappa_name, next_kappa_values)
-                    break
+            current_kappa = self._get_root(f"kappa_root_{kappa_index}")
+            self._set_root(f"kappa_root_{kappa_index + 1}", np.abs(np.diff(current_kappa)))
         return self.data_triangle_roots
 
     # Step 10: Combine all values of Data Triangle
     def combine_all_values_DT(self):
         max_length = max(len(array) for _, array in self.data_triangle_roots)
-        padded_data = {name: np.pad(array, (0, max_length - len(array)), constant_values=-99) for name, array in self.data_triangle_roots}
-        combined_array = []
-        for row_index in range(max_length):
-            for name in padded_data:
-                value = padded_data[name][row_index]
-                if value != -99:
-                    combined_array.append(value)
-        self.combined_values_of_data_triangle = np.array(combined_array)
+        padded_data = np.column_stack([np.pad(array, (0, max_length - len(array)), constant_values=-99) for _, array in self.data_triangle_roots])
+        # Row-major flattening walks the triangle row by row, then drop the padding
+        combined_array = padded_data.ravel()
+        self.combined_values_of_data_triangle = combined_array[combined_array != -99]
         return self.combined_values_of_data_triangle
 
     # Step 11: Create PVA array
     def create_pva_array(self):
-        self.pva_array = []
-        for i in range(len(self.combined_values_of_data_triangle) - 1):
-            if self.combined_values_of_data_triangle[i + 1] > self.combined_values_of_data_triangle[i]:
-                self.pva_array.append(1)
-            elif self.combined_values_of_data_triangle[i + 1] < self.combined_values_of_data_triangle[i]:
-                self.pva_array.append(0)
-            else:
-                self.pva_array.append(2)
-        self.pva_array.append(3)
-        self.pva_array = np.array(self.pva_array)
+        # Each neighbouring pair is 1 when rising, 0 when falling and 2 when flat;
+        # map the sign of the differences through a small table instead of comparing per pair
+        steps = np.sign(np.diff(np.asarray(self.combined_values_of_data_triangle)))
+        self.pva_array = np.append(_PVA_BY_SIGN[steps.astype(np.intp) + 1], 3)
         self.pva_length = len(self.pva_array)
         return self.pva_array, self.pva_length
 
@@ -221,16 +247,10 @@ class Enki_V3:
         """Create and initialize the PVA_Mods attribute."""
         if self.pva_array is None:
             raise ValueError("pva_array is not initialized. Call create_pva_array first.")
-        self.PVA_Mods = []
-        array_length = len(self.pva_array)
-        current_index = 0
-        for _ in range(self.N):
-            new_array = []
-            for _ in range(self.N):
-                new_array.append(self.pva_array[current_index])
-                current_index = (current_index + 1) % array_length
-            self.PVA_Mods.append(new_array)
-        self.PVA_Mods = np.array(self.PVA_Mods)
+        # Fill an N x N grid row by row, cycling through pva_array as often as needed
+        pva_array = np.asarray(self.pva_array)
+        cycled_index = np.arange(self.N * self.N) % len(pva_array)
+        self.PVA_Mods = pva_array[cycled_index].reshape(self.N, self.N)
         return self.PVA_Mods
 
     # Step 14: Create PVA Mods DF
@@ -249,14 +269,15 @@ class Enki_V3:
     def create_alpha_roots_post_pivot(self):
         epsilon_index = self.DT_df.columns.get_loc("epsilon_root")
         num_rows = len(self.DT_df)
+        # Read the anti-diagonals from the underlying array in one fancy-indexing gather
+        # each, rather than one .iloc lookup per cell
+        dt_values = self.DT_df.to_numpy()
         self.alpha_roots_post_pivot = {}
         start_index = len(self.alpha_roots_pre_pivot["Output Rows"])
         for col_index in range(epsilon_index, len(self.DT_df.columns)):
-            column_name = self.DT_df.columns[col_index]
-            anti_diagonal = []
-            for i in range(min(num_rows, col_index + 1)):
-                anti_diagonal.append(self.DT_df.iloc[i, col_index - i])
-            self.alpha_roots_post_pivot[f"alpha_{start_index}"] = anti_diagonal[::-1]
+            rows = np.arange(min(num_rows, col_index + 1))
+            anti_diagonal = dt_values[rows, col_index - rows]
+            self.alpha_roots_post_pivot[f"alpha_{start_index}"] = list(anti_diagonal[::-1])
             start_index += 1
         return self.alpha_roots_post_pivot
 
@@ -281,15 +302,17 @@ class Enki_V3:
     def create_alpha(self):
         self.alpha_values = {}
         all_repeater_values = self.alpha_roots_df.iloc[:, 4:].replace(-99, np.nan).stack().dropna().astype(int).tolist()
-        for index, row in self.alpha_roots_df.iterrows():
-            A_Root = [int(x) for x in row.iloc[:4].tolist()]
-            valid_repeater_values = row.iloc[4:][row.iloc[4:] != -99]
-            Repeater = int(valid_repeater_values.sum())
+        # Work on plain arrays/lists; iterrows would build a Series for every row
+        pv_mods_by_index = dict(zip(self.PVA_Mods_df.index, self.PVA_Mods_df.to_numpy().tolist()))
+        for index, row in zip(self.alpha_roots_df.index, self.alpha_roots_df.to_numpy()):
+            A_Root = [int(x) for x in row[:4]]
+            repeater_values = row[4:]
+            Repeater = int(repeater_values[repeater_values != -99].sum())
             if Repeater == 0:
                 Repeater = int(np.random.choice(all_repeater_values)) if all_repeater_values else -1
             adjusted_index = index.replace("alpha_root", "alpha") + "_PV_mod"
-            if adjusted_index in self.PVA_Mods_df.index:
-                alpha_PV_mod = [int(x) for x in self.PVA_Mods_df.loc[adjusted_index].tolist()]
+            if adjusted_index in pv_mods_by_index:
+                alpha_PV_mod = [int(x) for x in pv_mods_by_index[adjusted_index]]
             else:
                 alpha_PV_mod = [int(x) for x in self.PVA_Mods_df.sample(n=1).iloc[0].tolist()]
             self.alpha_values[f"{index}"] = {
@@ -333,88 +356,18 @@ class Enki_V3:
         self.N = self.Enki_User_Interface()
         if self.N is None:
             return
-        print(f"\n[Step 1] N: {self.N}")
-
-        # Step 2: Create the base array (phi_)
-        self.create_base()
-        print(f"\n[Step 2] phi_: {self.phi_}")
-
-        # Step 3: Create a list of root arrays
-        self.root_arrays()
-        print(f"\n[Step 3] Roots Arrays: {self.roots_list_}")
-
-        # Step 4: Create kappa root arrays
-        self.create_kappa_root_arrays()
-        print(f"\n[Step 4] Kappa Roots: {self.kappa_roots_}, Kappa Total: {self.kappa_total}")
-
-        # Step 5: Create data triangle roots
-        self.create_data_triangle_roots()
-        print(f"\n[Step 5] Data Triangle Roots: {self.data_triangle_roots}")
-
-        # Step 6: Update roots w/ (theta)
-        self.update_theta_root()
-        print(f"\n[Step 6] Data Triangle Roots w/ Theta: {self.data_triangle_roots}")
-
-        # Step 7: Update roots w/ (lambda)
-        self.update_lambda_root()
-        print(f"\n[Step 7] Data Triangle Roots w/ Lambda: {self.data_triangle_roots}")
-
-        # Step 8: Update roots w/ (epsilon)
-        self.update_epsilon_root()
-        print(f"\n[Step 8] Data Triangle Roots w/ Epsilon: {self.data_triangle_roots}")
-
-        # Step 9: Update roots w/ (kappa_roots_)
-        self.update_kappa_roots()
-        print(f"\n[Step 9] Data Triangle Roots w/ Kappa Roots: {self.data_triangle_roots}")
-
-        # Step 10: Combine all values of Data Triangle
-        self.combine_all_values_DT()
-        print(f"\n[Step 10] Combined Values of Data Triangle: {self.combined_values_of_data_triangle}")
-
-        # Step 11: Create PVA array
-        self.create_pva_array()
-        print(f"\n[Step 11] PVA Array: {self.pva_array}")
-
-        # Step 12: Create DataFrame for data triangle
-        self.create_DT_dataframe()
-        print(f"\n[Step 12] Data Triangle DataFrame:\n{self.DT_df}")
-
-        # Step 13: Create PVA Mods
-        self.create_PVA_Mods()
-        print(f"\n[Step 13] PVA Mods:\n{self.PVA_Mods}")
-
-        # Step 14: Create PVA Mods DF
-        self.create_PVA_Mods_dataframe()
-        print(f"\n[Step 14] PVA Mods DataFrame:\n{self.PVA_Mods_df}")
-
-        # Step 15: Create Alpha Roots Rows
-        self.create_alpha_roots_rows()
-        print(f"\n[Step 15] Alpha Roots Pre-Pivot:\n{self.alpha_roots_pre_pivot}")
-
-        # Step 16: Create Alpha Roots Post Pivot
-        self.create_alpha_roots_post_pivot()
-        print(f"\n[Step 16] Alpha Roots Post-Pivot:\n{self.alpha_roots_post_pivot}")
-
-        # Step 17: Combine Alpha Roots
-        self.combine_alpha_roots()
-        print(f"\n[Step 17] Combined Alpha Roots:\n{self.combined_alpha_roots}")
-
-        # Step 18: Create Alpha Roots DataFrame
-        self.create_alpha_roots_dataframe()
-        print(f"\n[Step 18] Alpha Roots DataFrame:\n{self.alpha_roots_df}")
-
-        # Step 19: Create Alpha Values
-        self.create_alpha()
-        print(f"\n[Step 19] Alpha Values:\n{self.alpha_values}")
-
-        # Step 20: Create Alpha Phorms DataFrame
-        self.create_alpha_phorms_dataframe()
-        print(f"\n[Step 20] Alpha DataFrame (Phorms):\n{self.alpha_phorms_dataframe}")
-
-        print("\n" + "="*50)
-        print("Data Generation Complete!")
-        print("Use AlphaTransformer class for transformations.")
-        print("="*50)
+        self._log("\n[Step 1] N: {}", self.N)
+
+        # Steps 2-20
+        for number, step in enumerate(self.GENERATION_STEPS, 2):
+            getattr(self, step)()
+            template, attributes = self._STEP_REPORTS[step]
+            self._log("\n[Step {}] " + template, number, *(getattr(self, name) for name in attributes))
+
+        self._log("\n" + "="*50)
+        self._log("Data Generation Complete!")
+        self._log("Use AlphaTransformer class for transformations.")
+        self._log("="*50)
         
         return self.get_alpha_data()
 
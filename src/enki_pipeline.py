@@ -34,97 +34,120 @@ from pathlib import Path
 
 # Add the src directory to Python path so we can import our modules
 # This ensures the script can find enki_class_v2 and alpha_transformer
-current_dir = Path(__file__).parent
-src_dir = current_dir
-sys.path.insert(0, str(src_dir))
+_SRC_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(_SRC_DIR))
 
 # Now import our custom modules
 from enki_class_v2 import Enki_V3
 from alpha_transformer import AlphaTransformer
 
-# Optional: Import these if you want to work with the data directly
-import pandas as pd
-import numpy as np
+# Where the interactive pipeline exports transformed alpha data
+_OUTPUT_DIR = Path("F:/Enki_V3/data/alpha_output")
+
+# Mod table menu entries, keyed by the number the user types
+_MOD_TABLE_OPTIONS = {
+    "1": {
+        "name": "default",
+        "description": "Standard transformations (subtract 1, add 1, add 2, add 3)"
+    },
+    "2": {
+        "name": "increment",
+        "description": "Incremental transformations (add 0, add 2, add 4, add 6)"
+    },
+    "3": {
+        "name": "custom",
+        "description": "Custom transformations (multiply by 2, square, subtract 3, add 5)"
+    },
+    "4": {
+        "name": "chromatic",
+        "description": "Chromatic transformations (12-tone pitch mapping) - General Theta focus"
+    },
+    "5": {
+        "name": "rhythmic",
+        "description": "Rhythmic transformations (note durations, tempo shifts, subdivisions) - Chi focus"
+    },
+    "6": {
+        "name": "harmonic",
+        "description": "Harmonic transformations (chord building, root/3rd/5th/7th) - Theta focus"
+    },
+    "7": {
+        "name": "modal",
+        "description": "Modal transformations (major, minor, phrygian scales) - Theta variations"
+    },
+    "8": {
+        "name": "octave",
+        "description": "Octave transformations (register shifts, inversions) - Lambda focus"
+    }
+}
+
+# Lookups used while parsing a selection, derived once from the menu above
+_VALID_KEYS = frozenset(_MOD_TABLE_OPTIONS)
+_NAME_BY_KEY = {key: info["name"] for key, info in _MOD_TABLE_OPTIONS.items()}
+_MUSICAL_KEYS = ("4", "5", "6", "7", "8")  # chromatic, rhythmic, harmonic, modal, octave
+_ALL_NAMES = tuple(_NAME_BY_KEY.values())
+_MUSICAL_NAMES = tuple(_NAME_BY_KEY[key] for key in _MUSICAL_KEYS)
+
+
+def _run_generation_steps(enki):
+    """
+    Runs the data generation steps on an Enki_V3 instance whose N is already set.
+    Used by the non-interactive modes, which skip the N prompt in run_pipeline.
+    """
+    for step in enki.GENERATION_STEPS:
+        getattr(enki, step)()
 
 
 def choose_mod_table():
     """
     Interactive function to let users choose their preferred mod table version(s).
+    For batch runs the selection can come from the ENKI_MOD_TABLES environment
+    variable or a single line of piped stdin (empty means 'all'); neither is
+    confirmed and neither re-prompts on an invalid entry.
     
     Returns:
         list: List of selected mod table versions, or None if cancelled
     """
-    print("\n" + "="*60)
-    print("SELECT MOD TABLE VERSION(S)")
-    print("="*60)
-    
-    mod_table_options = {
-        "1": {
-            "name": "default",
-            "description": "Standard transformations (subtract 1, add 1, add 2, add 3)"
-        },
-        "2": {
-            "name": "increment", 
-            "description": "Incremental transformations (add 0, add 2, add 4, add 6)"
-        },
-        "3": {
-            "name": "custom",
-            "description": "Custom transformations (multiply by 2, square, subtract 3, add 5)"
-        },
-        "4": {
-            "name": "chromatic",
-            "description": "Chromatic transformations (12-tone pitch mapping) - General Theta focus"
-        },
-        "5": {
-            "name": "rhythmic",
-            "description": "Rhythmic transformations (note durations, tempo shifts, subdivisions) - Chi focus"
-        },
-        "6": {
-            "name": "harmonic",
-            "description": "Harmonic transformations (chord building, root/3rd/5th/7th) - Theta focus"
-        },
-        "7": {
-            "name": "modal",
-            "description": "Modal transformations (major, minor, phrygian scales) - Theta variations"
-        },
-        "8": {
-            "name": "octave",
-            "description": "Octave transformations (register shifts, inversions) - Lambda focus"
-        }
-    }
+    # Build the whole menu first and write it with a single print
+    menu_lines = ["\n" + "="*60, "SELECT MOD TABLE VERSION(S)", "="*60, "Available mod table versions:"]
+    menu_lines.extend(
+        f"   {key}. {info['name'].upper()}\n      └─ {info['description']}"
+        for key, info in _MOD_TABLE_OPTIONS.items()
+    )
+    menu_lines.extend([
+        "\n🎯 Selection Options:",
+        "   • Single choice: Enter one number (e.g., '4' for chromatic only)",
+        "   • Multiple choices: Enter numbers separated by commas (e.g., '4,6,7' for chromatic, harmonic, and modal)",
+        "   • All musical: Enter 'music' for all musical transformations (4,5,6,7,8)",
+        "   • All available: Enter 'all' for every transformation option",
+    ])
+    print("\n".join(menu_lines))
     
-    print("Available mod table versions:")
-    for key, info in mod_table_options.items():
-        print(f"   {key}. {info['name'].upper()}")
-        print(f"      └─ {info['description']}")
-    
-    print("\n🎯 Selection Options:")
-    print("   • Single choice: Enter one number (e.g., '4' for chromatic only)")
-    print("   • Multiple choices: Enter numbers separated by commas (e.g., '4,6,7' for chromatic, harmonic, and modal)")
-    print("   • All musical: Enter 'music' for all musical transformations (4,5,6,7,8)")
-    print("   • All available: Enter 'all' for every transformation option")
+    env_choice = os.environ.get("ENKI_MOD_TABLES")
+    interactive = env_choice is None and sys.stdin.isatty()
     
     while True:
         try:
-            print(f"\nPlease choose mod table version(s) (1-{len(mod_table_options)}):", end=" ")
-            choice = input().strip().lower()
+            if env_choice is not None:
+                choice = env_choice.strip().lower()
+                print(f"\nUsing ENKI_MOD_TABLES='{choice}'")
+            elif not interactive:
+                choice = sys.stdin.readline().strip().lower() or 'all'
+            else:
+                print(f"\nPlease choose mod table version(s) (1-{len(_MOD_TABLE_OPTIONS)}):", end=" ")
+                choice = input().strip().lower()
             
             selected_versions = []
             
             # Handle special keywords
             if choice == 'all':
-                selected_versions = [info['name'] for info in mod_table_options.values()]
-                print("✅ Selected: ALL TRANSFORMATIONS")
-                for info in mod_table_options.values():
-                    print(f"   ✓ {info['name'].upper()}")
+                selected_versions = list(_ALL_NAMES)
+                print("\n".join(["✅ Selected: ALL TRANSFORMATIONS"] +
+                                [f"   ✓ {name.upper()}" for name in _ALL_NAMES]))
                     
             elif choice == 'music':
-                musical_keys = ['4', '5', '6', '7', '8']  # chromatic, rhythmic, harmonic, modal, octave
-                selected_versions = [mod_table_options[key]['name'] for key in musical_keys]
-                print("✅ Selected: ALL MUSICAL TRANSFORMATIONS")
-                for key in musical_keys:
-                    info = mod_table_options[key]
-                    print(f"   ✓ {info['name'].upper()}")
+                selected_versions = list(_MUSICAL_NAMES)
+                print("\n".join(["✅ Selected: ALL MUSICAL TRANSFORMATIONS"] +
+                                [f"   ✓ {name.upper()}" for name in selected_versions]))
                     
             else:
                 # Handle comma-separated choices
@@ -132,18 +155,24 @@ def choose_mod_table():
                 valid_choices = []
                 
                 for c in choices:
-                    if c in mod_table_options:
+                    if c in _VALID_KEYS:
                         valid_choices.append(c)
-                        selected_versions.append(mod_table_options[c]['name'])
+                        selected_versions.append(_NAME_BY_KEY[c])
                     else:
-                        print(f"❌ Invalid choice '{c}'. Please enter numbers between 1 and {len(mod_table_options)}.")
+                        print(f"❌ Invalid choice '{c}'. Please enter numbers between 1 and {len(_MOD_TABLE_OPTIONS)}.")
+                        if not interactive:
+                            # A partial batch selection would run silently; reject the whole entry
+                            selected_versions = []
                         break
                 else:
                     if valid_choices:
-                        print("✅ Selected transformations:")
-                        for c in valid_choices:
-                            info = mod_table_options[c]
-                            print(f"   ✓ {info['name'].upper()} - {info['description']}")
+                        print("\n".join(["✅ Selected transformations:"] + [
+                            f"   ✓ {_MOD_TABLE_OPTIONS[c]['name'].upper()} - {_MOD_TABLE_OPTIONS[c]['description']}"
+                            for c in valid_choices
+                        ]))
+            
+            if selected_versions and not interactive:
+                return selected_versions
             
             if selected_versions:
                 # Confirm choice
@@ -158,6 +187,10 @@ def choose_mod_table():
                 else:
                     print("Selection cancelled. Please choose again.")
                     continue
+            elif not interactive:
+                # Nobody is there to answer a re-prompt
+                print("❌ No valid mod table selection provided.")
+                return None
             else:
                 print("No valid selections made. Please try again.")
                 
@@ -176,127 +209,127 @@ def main():
     print("Working directory:", os.getcwd())
     print("Script location:", __file__)
     
+    # Step 1: Generate alpha data using Enki_V3
+    print("\n" + "="*60)
+    print("ENKI V3 - DATA GENERATION")
+    print("="*60)
+    
+    # Initialize the data generator
+    enki = Enki_V3()
+    
+    # Run the complete data generation pipeline
     try:
-        # Step 1: Generate alpha data using Enki_V3
-        print("\n" + "="*60)
-        print("ENKI V3 - DATA GENERATION")
-        print("="*60)
-        
-        # Initialize the data generator
-        enki = Enki_V3()
-        
-        # Run the complete data generation pipeline
         alpha_data = enki.run_pipeline()
+    except (ValueError, OSError) as e:
+        print(f"❌ Data generation failed: {e}")
+        return False
+    
+    if alpha_data is None:
+        print("❌ Data generation was cancelled or failed.")
+        return False
+    
+    # Bind the generated values once; every transformation below reuses them
+    alpha_df = alpha_data['alpha_phorms_dataframe']
+    N_val = alpha_data['N']
+    phi_val = alpha_data['phi_']
+    
+    print("✅ Data generation completed successfully!")
+    print(f"   - N value: {N_val}")
+    print(f"   - Phi array: {phi_val}")
+    print(f"   - Alpha phorms shape: {alpha_df.shape}")
+    
+    # Step 2: Choose mod table version(s)
+    selected_mod_tables = choose_mod_table()
+    if selected_mod_tables is None:
+        print("❌ Mod table selection was cancelled.")
+        return False
+    
+    # Step 3: Transform the data using AlphaTransformer for each selected mod table
+    print("\n" + "="*60)
+    print("ALPHA TRANSFORMATION(S)")
+    print("="*60)
+    
+    successful_exports = []
+    failed_exports = []
+    
+    # Extract the alpha columns once; every mod table below reads the same arrays
+    alpha_arrays = AlphaTransformer.prepare_alpha_arrays(alpha_df)
+    
+    for i, mod_table_name in enumerate(selected_mod_tables, 1):
+        print(f"\n🔄 Processing transformation {i}/{len(selected_mod_tables)}: {mod_table_name.upper()}")
+        print("-" * 50)
         
-        if alpha_data is None:
-            print("❌ Data generation was cancelled or failed.")
-            return False
+        # Create transformer with selected mod table
+        transformer = AlphaTransformer(
+            mod_table_version=mod_table_name,
+            output_dir=_OUTPUT_DIR
+        )
         
-        print("✅ Data generation completed successfully!")
-        print(f"   - N value: {alpha_data['N']}")
-        print(f"   - Phi array: {alpha_data['phi_']}")
-        print(f"   - Alpha phorms shape: {alpha_data['alpha_phorms_dataframe'].shape}")
+        print(f"   - Mod table version: {transformer.mod_table_version}")
+        print(f"   - Output directory: {transformer.output_dir}")
         
-        # Step 2: Choose mod table version(s)
-        selected_mod_tables = choose_mod_table()
-        if selected_mod_tables is None:
-            print("❌ Mod table selection was cancelled.")
+        # Transform the alpha data
+        try:
+            transformed_data = transformer.transform_from_arrays(alpha_arrays)
+        except (ValueError, OSError) as e:
+            print(f"❌ Transformation failed: {e}")
             return False
         
-        # Step 3: Transform the data using AlphaTransformer for each selected mod table
-        print("\n" + "="*60)
-        print("ALPHA TRANSFORMATION(S)")
-        print("="*60)
-        
-        successful_exports = []
-        failed_exports = []
-        
-        for i, mod_table_name in enumerate(selected_mod_tables, 1):
-            print(f"\n🔄 Processing transformation {i}/{len(selected_mod_tables)}: {mod_table_name.upper()}")
-            print("-" * 50)
+        if transformed_data is not None:
+            print(f"   ✅ {mod_table_name} transformation completed!")
+            print(f"      └─ Transformed data shape: {transformed_data.shape}")
             
-            # Create transformer with selected mod table
-            transformer = AlphaTransformer(
-                mod_table_version=mod_table_name,
-                output_dir="F:/Enki_V3/data/alpha_output"
-            )
+            # Export the transformed data
+            output_file = transformer.export_transformed_data(N=N_val, phi_=phi_val)
             
-            print(f"   - Mod table version: {transformer.mod_table_version}")
-            print(f"   - Output directory: {transformer.output_dir}")
-            
-            # Transform the alpha data
-            print(f"   - Starting {mod_table_name} transformation...")
-            transformed_data = transformer.transform_alpha_dataframe(
-                alpha_data['alpha_phorms_dataframe']
-            )
-            
-            if transformed_data is not None:
-                print(f"   ✅ {mod_table_name} transformation completed!")
-                print(f"      └─ Transformed data shape: {transformed_data.shape}")
-                
-                # Export the transformed data
-                print(f"   - Exporting {mod_table_name} data...")
-                output_file = transformer.export_transformed_data(
-                    N=alpha_data['N'],
-                    phi_=alpha_data['phi_']
-                )
-                
-                if output_file:
-                    print(f"   ✅ {mod_table_name} export completed!")
-                    print(f"      └─ File: {output_file.split('/')[-1]}")
-                    print(f"      └─ Size: {os.path.getsize(output_file)} bytes")
-                    successful_exports.append((mod_table_name, output_file))
-                else:
-                    print(f"   ❌ {mod_table_name} export failed!")
-                    failed_exports.append(mod_table_name)
+            if output_file:
+                # Resolve the name once; the summary below reuses it
+                output_path = Path(output_file)
+                basename = output_path.name
+                print(f"   ✅ {mod_table_name} export completed!")
+                print(f"      └─ File: {basename}")
+                print(f"      └─ Size: {output_path.stat().st_size} bytes")
+                successful_exports.append((mod_table_name, basename))
             else:
-                print(f"   ❌ {mod_table_name} transformation failed!")
+                print(f"   ❌ {mod_table_name} export failed!")
                 failed_exports.append(mod_table_name)
-        
-        print("\n" + "="*60)
-        print("🎉 PIPELINE COMPLETED! 🎉")
-        print("="*60)
-        print("\nSummary:")
-        print(f"✓ Generated data for N={alpha_data['N']}")
-        print(f"✓ Processed {len(alpha_data['alpha_values'])} alpha values")
-        
-        if successful_exports:
-            print(f"✓ Successfully applied {len(successful_exports)} transformation(s):")
-            for mod_table_name, output_file in successful_exports:
-                print(f"   ✓ {mod_table_name.upper()}: {output_file.split('/')[-1]}")
-        
-        if failed_exports:
-            print(f"❌ Failed transformations ({len(failed_exports)}):")
-            for mod_table_name in failed_exports:
-                print(f"   ❌ {mod_table_name.upper()}")
-        
-        # Return success only if we have at least one successful export
-        if not successful_exports:
-            print("\n❌ No transformations were successful!")
-            return False
-        
-        # Future: You could easily add different transformation types
-        print("\n🎵 Musical transformations now available!")
-        print("   ✓ Rhythmic: Focus on Chi values (note durations, tempo)")
-        print("   ✓ Harmonic: Focus on Theta values (pitch relationships, chords)")
-        print("   ✓ Modal: Focus on Theta variations (scales, modes)")
-        print("   ✓ Octave: Focus on Lambda values (register, transposition)")
-        print("\n📋 Future expansion possibilities:")
-        print("   - transformer.apply_epsilon_modifiers(transformed_data, 'dynamics_articulations')")
-        print("   - transformer.apply_musical_forms(transformed_data, 'sonata_form')")
-        
-        return True
-        
-    except Exception as e:
-        print(f"\n❌ Error occurred during pipeline execution:")
-        print(f"   Error type: {type(e).__name__}")
-        print(f"   Error message: {str(e)}")
-        print(f"   Check that all required files are present:")
-        print(f"   - enki_class_v2.py")
-        print(f"   - alpha_transformer.py") 
-        print(f"   - phorms_mod_table.py")
-        print(f"   - tests/ directory for development files")
+        else:
+            print(f"   ❌ {mod_table_name} transformation failed!")
+            failed_exports.append(mod_table_name)
+    
+    print("\n" + "="*60)
+    print("🎉 PIPELINE COMPLETED! 🎉")
+    print("="*60)
+    print("\nSummary:")
+    print(f"✓ Generated data for N={N_val}")
+    print(f"✓ Processed {len(alpha_data['alpha_values'])} alpha values")
+    
+    if successful_exports:
+        print(f"✓ Successfully applied {len(successful_exports)} transformation(s):")
+        for mod_table_name, basename in successful_exports:
+            print(f"   ✓ {mod_table_name.upper()}: {basename}")
+    
+    if failed_exports:
+        print(f"❌ Failed transformations ({len(failed_exports)}):")
+        for mod_table_name in failed_exports:
+            print(f"   ❌ {mod_table_name.upper()}")
+    
+    # Return success only if we have at least one successful export
+    if not successful_exports:
+        print("\n❌ No transformations were successful!")
         return False
+    
+    # Future: You could easily add different transformation types
+    print("\n🎵 Musical transformations now available!")
+    print("   ✓ Rhythmic: Focus on Chi values (note durations, tempo)")
+    print("   ✓ Harmonic: Focus on Theta values (pitch relationships, chords)")
+    print("   ✓ Modal: Focus on Theta variations (scales, modes)")
+    print("   ✓ Octave: Focus on Lambda values (register, transposition)")
+    print("\n📋 Future expansion possibilities:")
+    print("   - transformer.apply_epsilon_modifiers(transformed_data, 'dynamics_articulations')")
+    print("   - transformer.apply_musical_forms(transformed_data, 'sonata_form')")
+    
+    return True
 
 
 def demonstrate_flexibility():
@@ -317,25 +350,7 @@ def demonstrate_flexibility():
         
         # Run the pipeline steps programmatically
         print("Running data generation steps...")
-        enki.create_base()
-        enki.root_arrays()
-        enki.create_kappa_root_arrays()
-        enki.create_data_triangle_roots()
-        enki.update_theta_root()
-        enki.update_lambda_root()
-        enki.update_epsilon_root()
-        enki.update_kappa_roots()
-        enki.combine_all_values_DT()
-        enki.create_pva_array()
-        enki.create_DT_dataframe()
-        enki.create_PVA_Mods()
-        enki.create_PVA_Mods_dataframe()
-        enki.create_alpha_roots_rows()
-        enki.create_alpha_roots_post_pivot()
-        enki.combine_alpha_roots()
-        enki.create_alpha_roots_dataframe()
-        enki.create_alpha()
-        enki.create_alpha_phorms_dataframe()
+        _run_generation_steps(enki)
         
         print("✅ Data generation completed programmatically!")
         print(f"   - Generated phi: {enki.phi_}")
@@ -345,12 +360,14 @@ def demonstrate_flexibility():
         print("\nTesting multiple transformation approaches...")
         
         # Test all available mod tables programmatically
-        mod_tables = ["default", "increment", "custom", "chromatic", "rhythmic", "harmonic", "modal", "octave"]
+        mod_tables = _ALL_NAMES
+        
+        # Every table reads the same alpha data, so run them all in one pass over it
+        results = AlphaTransformer.transform_multi(enki.alpha_phorms_dataframe, mod_tables, verbose=True)
         
         for mod_table in mod_tables:
             print(f"\n   Testing '{mod_table}' mod table...")
-            transformer = AlphaTransformer(mod_table_version=mod_table)
-            result = transformer.transform_alpha_dataframe(enki.alpha_phorms_dataframe)
+            result = results[mod_table]
             
             if result is not None:
                 print(f"   ✅ '{mod_table}' transformation successful! Shape: {result.shape}")
@@ -379,25 +396,7 @@ def quick_test_run():
         
         # Run abbreviated pipeline for testing
         print("Running quick test with N=6...")
-        enki.create_base()
-        enki.root_arrays()
-        enki.create_kappa_root_arrays()
-        enki.create_data_triangle_roots()
-        enki.update_theta_root()
-        enki.update_lambda_root()
-        enki.update_epsilon_root()
-        enki.update_kappa_roots()
-        enki.combine_all_values_DT()
-        enki.create_pva_array()
-        enki.create_DT_dataframe()
-        enki.create_PVA_Mods()
-        enki.create_PVA_Mods_dataframe()
-        enki.create_alpha_roots_rows()
-        enki.create_alpha_roots_post_pivot()
-        enki.combine_alpha_roots()
-        enki.create_alpha_roots_dataframe()
-        enki.create_alpha()
-        enki.create_alpha_phorms_dataframe()
+        _run_generation_steps(enki)
         
         # Quick transformation test
         transformer = AlphaTransformer()
@@ -428,34 +427,46 @@ if __name__ == "__main__":
     3. python enki_pipeline.py demo         # Demonstrate flexibility
     """
     
-    # Check command line arguments for different run modes
-    if len(sys.argv) > 1:
-        mode = sys.argv[1].lower()
-        
-        if mode == "test":
-            print("🚀 Running in QUICK TEST mode...")
-            success = quick_test_run()
+    try:
+        # Check command line arguments for different run modes
+        if len(sys.argv) > 1:
+            mode = sys.argv[1].lower()
+            
+            if mode == "test":
+                print("🚀 Running in QUICK TEST mode...")
+                success = quick_test_run()
             
-        elif mode == "demo":
-            print("🚀 Running in DEMONSTRATION mode...")
-            success = demonstrate_flexibility()
+            elif mode == "demo":
+                print("🚀 Running in DEMONSTRATION mode...")
+                success = demonstrate_flexibility()
             
-        elif mode == "help":
-            print("📖 ENKI V3 Usage Help:")
-            print("   python enki_pipeline.py        # Full interactive pipeline")
-            print("   python enki_pipeline.py test   # Quick automated test")
-            print("   python enki_pipeline.py demo   # Demonstrate flexibility")
-            print("   python enki_pipeline.py help   # Show this help")
-            sys.exit(0)
+            elif mode == "help":
+                print("📖 ENKI V3 Usage Help:")
+                print("   python enki_pipeline.py        # Full interactive pipeline")
+                print("   python enki_pipeline.py test   # Quick automated test")
+                print("   python enki_pipeline.py demo   # Demonstrate flexibility")
+                print("   python enki_pipeline.py help   # Show this help")
+                sys.exit(0)
             
+            else:
+                print(f"❓ Unknown mode: {mode}")
+                print("   Use 'help' for usage options")
+                sys.exit(1)
         else:
-            print(f"❓ Unknown mode: {mode}")
-            print("   Use 'help' for usage options")
-            sys.exit(1)
-    else:
-        # Default: run the full interactive pipeline
-        print("🚀 Running FULL INTERACTIVE pipeline...")
-        success = main()
+            # Default: run the full interactive pipeline
+            print("🚀 Running FULL INTERACTIVE pipeline...")
+            success = main()
+    except Exception as e:
+        # Anything main()/the other modes did not handle themselves ends up here
+        print(f"\n❌ Error occurred during pipeline execution:")
+        print(f"   Error type: {type(e).__name__}")
+        print(f"   Error message: {str(e)}")
+        print(f"   Check that all required files are present:")
+        print(f"   - enki_class_v2.py")
+        print(f"   - alpha_transformer.py") 
+        print(f"   - phorms_mod_table.py")
+        print(f"   - tests/ directory for development files")
+        sys.exit(1)
     
     # Exit with appropriate code
     if success:
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Checks the lookup-table transformation against applying each mod table lambda per value
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Add the src directory to Python path
+current_dir = Path(__file__).parent
+sys.path.insert(0, str(current_dir.parent))
+
+from enki_class_v2 import Enki_V3
+from alpha_transformer import AlphaTransformer
+from phorms_mod_table import phorms_mod_table
+from enki_pipeline import _ALL_NAMES as MOD_TABLES, _run_generation_steps
+
+
+def reference_transform(alpha_phorms_dataframe, mod_table_version, max_value=9):
+    """Straightforward per-value transformation used as the expected result."""
+    transformations = phorms_mod_table(mod_table_version)['Transformation'].to_dict()
+    expected = {}
+    for index, row in alpha_phorms_dataframe.iterrows():
+        modified_versions = [[int(x) for x in row['A_Root']]]
+        for mod in row['Alpha_PV_Mod']:
+            transform = transformations.get(int(mod))
+            if transform is not None:
+                transformed_row = []
+                for value in row['A_Root_Copy']:
+                    result = transform(int(value))
+                    transformed_row.append(int(result % (max_value + 1)) if result >= 0 else max_value)
+                modified_versions.append(transformed_row)
+        repeater = int(row['Repeater'])
+        expected[f"alpha_phormed_{index.split('_')[-1]}"] = modified_versions * repeater if repeater else modified_versions
+    return expected
+
+
+def generate_alpha_data(N):
+    """Runs the generation steps and returns the alpha phorms DataFrame."""
+    enki = Enki_V3(verbose=False)
+    enki.N = N
+    _run_generation_steps(enki)
+    return enki.alpha_phorms_dataframe
+
+
+def check(alpha_phorms_dataframe, label):
+    """Compares every mod table against the reference; returns the number of mismatches."""
+    failures = 0
+    for mod_table in MOD_TABLES:
+        transformer = AlphaTransformer(mod_table_version=mod_table, verbose=False)
+        result = transformer.transform_alpha_dataframe(alpha_phorms_dataframe)
+        expected = reference_transform(alpha_phorms_dataframe, mod_table)
+        if result['Alpha_Phormed'].to_dict() != expected:
+            print(f"   ❌ {label}: '{mod_table}' differs from the per-value reference")
+            failures += 1
+    if not failures:
+        print(f"   ✅ {label}: all {len(MOD_TABLES)} mod tables match")
+    return failures
+
+
+def run_lookup_checks():
+    """
+    Generated data for several N values, plus a mod value the tables do not define.
+    Returns the number of failed checks.
+    """
+
+    print("🧪 Testing vectorized alpha transformation")
+    print("="*50)
+
+    failures = 0
+    for N in (6, 8, 11):
+        alpha_df = generate_alpha_data(N)
+        failures += check(alpha_df, f"N={N}")
+
+        # Mod values outside the table are skipped rather than transformed
+        unknown_mod_df = alpha_df.copy()
+        unknown_mod_df['Alpha_PV_Mod'] = [[7] + list(mods[1:]) for mods in alpha_df['Alpha_PV_Mod']]
+        failures += check(unknown_mod_df, f"N={N} with unknown mod")
+
+        # Rows of different lengths cannot be stacked and take the per-row path
+        ragged_df = alpha_df.copy()
+        ragged_df.at[ragged_df.index[0], 'A_Root_Copy'] = list(alpha_df['A_Root_Copy'].iloc[0][:2])
+        ragged_df.at[ragged_df.index[-1], 'Alpha_PV_Mod'] = list(alpha_df['Alpha_PV_Mod'].iloc[-1]) + [7, 1]
+        failures += check(ragged_df, f"N={N} with ragged rows")
+
+    # An empty frame still produces an (empty) result
+    empty_df = pd.DataFrame(columns=['A_Root', 'A_Root_Copy', 'Alpha_PV_Mod', 'Repeater'])
+    result = AlphaTransformer(verbose=False).transform_alpha_dataframe(empty_df)
+    if result is None or len(result) != 0:
+        print("   ❌ Empty input did not give an empty result")
+        failures += 1
+
+    print(f"\n🎉 Finished with {failures} failure(s)")
+    return failures
+
+
+def test_lookup_matches_reference():
+    """Fails under pytest when any check differs from the per-value reference."""
+    failures = run_lookup_checks()
+    assert failures == 0, f"{failures} mismatch(es)"
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_lookup_checks() == 0 else 1)